@@ -6,6 +6,8 @@ import pytest
 # defaults for reference
 sample_article_count = 10
 sample_timeout = 10
+sample_cache = False
+sample_per_topic = False
 sample_topic = "test"  # must provide at least 1 topic; the name has to be a valid non-empty str
 
 # P.S. A little bit tricky to test ArgumentParser as even when ArgumentTypeError is raised
@@ -13,7 +15,8 @@ sample_topic = "test"  # must provide at least 1 topic; the name has to be a val
 
 
 class TestClass:
-    parser = create_parser()  # no point in recreating the same parser multiple times
+    # create_parser is cached, so calling it inline always returns the
+    # same parser instance and costs nothing after the first call
 
     @pytest.mark.parametrize(
         "test_input,expected",
@@ -21,19 +24,27 @@ class TestClass:
             (
                 "1",
                 Namespace(
-                    topic=[sample_topic], article_count=sample_article_count, timeout=1
+                    topic=[sample_topic],
+                    article_count=sample_article_count,
+                    timeout=1,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
             (
                 "20",
                 Namespace(
-                    topic=[sample_topic], article_count=sample_article_count, timeout=20
+                    topic=[sample_topic],
+                    article_count=sample_article_count,
+                    timeout=20,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
         ],
     )
     def test_timeout_parsing(self, test_input: str, expected: Namespace):
-        to_compare: Namespace = TestClass.parser.parse_args(
+        to_compare: Namespace = create_parser().parse_args(
             f"-t {sample_topic} --timeout {test_input}".split()
         )
         assert to_compare == expected
@@ -44,19 +55,27 @@ class TestClass:
             (
                 "1",
                 Namespace(
-                    topic=[sample_topic], article_count=1, timeout=sample_timeout
+                    topic=[sample_topic],
+                    article_count=1,
+                    timeout=sample_timeout,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
             (
                 "5",
                 Namespace(
-                    topic=[sample_topic], article_count=5, timeout=sample_timeout
+                    topic=[sample_topic],
+                    article_count=5,
+                    timeout=sample_timeout,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
         ],
     )
     def test_count_parsing(self, test_input: str, expected: Namespace):
-        to_compare: Namespace = TestClass.parser.parse_args(
+        to_compare: Namespace = create_parser().parse_args(
             f"-t {sample_topic} -c {test_input}".split()
         )
         assert to_compare == expected
@@ -65,7 +84,7 @@ class TestClass:
     def test_timeout_non_int(self, test_input: str):
         """tests trying to pass non-int timeout(should fail)"""
         with pytest.raises(SystemExit):
-            TestClass.parser.parse_args(
+            create_parser().parse_args(
                 f"-t {sample_topic} --timeout {test_input}".split()
             )
 
@@ -73,7 +92,7 @@ class TestClass:
     def test_count_non_int(self, test_input: str):
         """tests trying to pass non-int counts(should fail)"""
         with pytest.raises(SystemExit):
-            TestClass.parser.parse_args(f"-t {sample_topic} -c {test_input}".split())
+            create_parser().parse_args(f"-t {sample_topic} -c {test_input}".split())
 
     @pytest.mark.parametrize("test_input", [("61"), ("1000"), ("-200")])
     def test_timeout_bounds_exception(self, test_input: str):
@@ -81,7 +100,7 @@ class TestClass:
         (ex. too large or negative)"""
         # if an exception is raised, the bounds are rejected
         with pytest.raises(SystemExit):
-            TestClass.parser.parse_args(
+            create_parser().parse_args(
                 f"-t {sample_topic} --timeout {test_input}".split()
             )
 
@@ -91,12 +110,12 @@ class TestClass:
         (ex. too large or negative)"""
         # if an exception is raised, the bounds are rejected
         with pytest.raises(SystemExit):
-            TestClass.parser.parse_args(f"-t {sample_topic} -c {test_input}".split())
+            create_parser().parse_args(f"-t {sample_topic} -c {test_input}".split())
 
     def test_no_topic_provided(self):
         """tests if a required arg is not provided"""
         with pytest.raises(SystemExit):
-            TestClass.parser.parse_args([])
+            create_parser().parse_args([])
 
     @pytest.mark.parametrize(
         "test_input,expected",
@@ -107,6 +126,8 @@ class TestClass:
                     topic=["a", "b"],
                     article_count=sample_article_count,
                     timeout=sample_timeout,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
             (
@@ -115,6 +136,8 @@ class TestClass:
                     topic=["a", "b"],
                     article_count=sample_article_count,
                     timeout=sample_timeout,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
             (
@@ -123,6 +146,8 @@ class TestClass:
                     topic=["a", "b"],
                     article_count=sample_article_count,
                     timeout=sample_timeout,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
             (
@@ -131,11 +156,13 @@ class TestClass:
                     topic=["a", "b"],
                     article_count=sample_article_count,
                     timeout=sample_timeout,
+                    cache=sample_cache,
+                    per_topic=sample_per_topic,
                 ),
             ),
         ],
     )
     def test_multiple_topic_provided(self, test_input: str, expected: Namespace):
         """tests if the parse can accurately parse multiple topics"""
-        to_compare: Namespace = TestClass.parser.parse_args(test_input.split())
+        to_compare: Namespace = create_parser().parse_args(test_input.split())
         assert to_compare == expected